@@ -3,70 +3,23 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Mapping
 import json
+import os
+import random
 from typing import TYPE_CHECKING, Any, Dict, Literal, NotRequired, TypedDict
 
 if TYPE_CHECKING:
-    from openai.types.chat import (
-        ChatCompletionAssistantMessageParam,
-        ChatCompletionMessage,
-        ChatCompletionMessageParam,
-        ChatCompletionSystemMessageParam,
-        ChatCompletionToolMessageParam,
-        ChatCompletionUserMessageParam,
-    )
-
-    # Handle ChatCompletionMessageFunctionToolCallParam separately
-    try:
-        from openai.types.chat import ChatCompletionMessageFunctionToolCallParam
-    except ImportError:
-        # Fallback for older versions
-        ChatCompletionMessageFunctionToolCallParam = Dict[str, Any]
-
-    # Handle different OpenAI library versions for imports
-    try:
-        from openai.types.chat import ChatCompletionFunctionToolParam
-    except ImportError:
-        # Fallback for older versions - create a type alias
-        ChatCompletionFunctionToolParam = Dict[str, Any]
-
-    try:
-        from openai.types.chat.chat_completion_message_function_tool_call_param import Function
-    except ImportError:
-        # Fallback for older versions
-        class Function(TypedDict):
-            name: str
-            arguments: str
-
-    try:
-        from openai.types.shared_params import FunctionDefinition
-    except ImportError:
-        # Fallback for older versions
-        class FunctionDefinition(TypedDict):
-            name: str
-            description: NotRequired[str]
-            parameters: NotRequired[Dict[str, Any]]
-
-    # Handle different OpenAI library versions
-    try:
-        from openai.types.shared_params import ResponseFormatJSONSchema
-        from openai.types.shared_params.response_format_json_schema import JSONSchema
-    except ImportError:
-        # Fallback for older OpenAI library versions
-
-        class JSONSchema(TypedDict, total=False):
-            """Fallback JSONSchema type."""
-            name: str
-            description: str | None
-            schema: dict[str, Any]
-            strict: bool | None
-
-        class ResponseFormatJSONSchema(TypedDict):
-            """Fallback ResponseFormatJSONSchema type."""
-            type: Literal["json_schema"]
-            json_schema: JSONSchema
+    from openai.types.chat import ChatCompletionMessage, ChatCompletionMessageParam
+
+import openai
+from openai.types.chat import (
+    ChatCompletionAssistantMessageParam,
+    ChatCompletionSystemMessageParam,
+    ChatCompletionToolMessageParam,
+    ChatCompletionUserMessageParam,
+)
+import orjson
 import voluptuous as vol
 from voluptuous_openapi import convert
 
@@ -80,31 +33,137 @@ from homeassistant.helpers.entity import Entity
 from . import OpenRouterConfigEntry
 from .const import DOMAIN, LOGGER
 
+# Prefer the SIMD accelerated encoder for image attachments when available
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore[no-redef]
+
+# Handle ChatCompletionMessageFunctionToolCallParam separately
+try:
+    from openai.types.chat import ChatCompletionMessageFunctionToolCallParam
+except ImportError:
+    # Fallback for older versions
+    ChatCompletionMessageFunctionToolCallParam = dict  # type: ignore[assignment,misc]
+
+try:
+    from openai.types.chat.chat_completion_message_function_tool_call_param import Function
+except ImportError:
+    # Fallback for older versions
+    class Function(TypedDict):  # type: ignore[no-redef]
+        name: str
+        arguments: str
+
+# Handle different OpenAI library versions for imports
+try:
+    from openai.types.chat import ChatCompletionFunctionToolParam
+except ImportError:
+    # Fallback for older versions
+    ChatCompletionFunctionToolParam = dict  # type: ignore[assignment,misc]
+
+try:
+    from openai.types.shared_params import FunctionDefinition
+except ImportError:
+    # Fallback for older versions
+    class FunctionDefinition(TypedDict):  # type: ignore[no-redef]
+        name: str
+        description: NotRequired[str]
+        parameters: NotRequired[Dict[str, Any]]
+
+# Handle different OpenAI library versions
+try:
+    from openai.types.shared_params import ResponseFormatJSONSchema
+    from openai.types.shared_params.response_format_json_schema import JSONSchema
+
+    _HAS_RF_JSON_SCHEMA = True
+except ImportError:
+    # Fallback for older OpenAI library versions
+    _HAS_RF_JSON_SCHEMA = False
+
+    class JSONSchema(TypedDict, total=False):  # type: ignore[no-redef]
+        """Fallback JSONSchema type."""
+        name: str
+        description: str | None
+        schema: dict[str, Any]
+        strict: bool | None
+
+    class ResponseFormatJSONSchema(TypedDict):  # type: ignore[no-redef]
+        """Fallback ResponseFormatJSONSchema type."""
+        type: Literal["json_schema"]
+        json_schema: JSONSchema
+
 # Max number of back and forth with the LLM to generate a response
 MAX_TOOL_ITERATIONS = 10
 
+# Base delay in seconds before retrying a request, per retryable status code
+RETRY_BASE_DELAYS = {503: 5, 429: 10}
+
+# Upper bound in seconds for a single retry delay
+MAX_RETRY_DELAY = 60
+
+# Sent along with every chat completion request
+EXTRA_HEADERS = {
+    "X-Title": "Home Assistant",
+    "HTTP-Referer": "https://www.home-assistant.io/integrations/open_router",
+}
+EXTRA_BODY = {"require_parameters": True}
+
+# Chunk size used when base64 encoding attachments, a multiple of 3 so every
+# chunk but the last encodes without padding
+_BASE64_CHUNK_SIZE = 3 * 64 * 1024
+
+# Attribute holding the memoized message on chat log content
+_MESSAGE_ATTR = "_openrouter_message"
+
+# Attachment attributes to probe, in order of preference
+_CONTENT_TYPE_ATTRS = ("content_type", "mime_type", "type")
+_CONTENT_ATTRS = (
+    "content",
+    "data",
+    "binary_data",
+    "bytes",
+    "file_content",
+    "image_data",
+    "payload",
+)
+_FILE_PATH_ATTRS = ("file_path", "path")
+
+_IMAGE_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
 
 def _adjust_schema(schema: dict[str, Any]) -> None:
     """Adjust the schema to be compatible with OpenRouter API."""
-    if schema["type"] == "object":
-        if "properties" not in schema:
-            return
-
-        if "required" not in schema:
-            schema["required"] = []
-
-        # Ensure all properties are required
-        for prop, prop_info in schema["properties"].items():
-            _adjust_schema(prop_info)
-            if prop not in schema["required"]:
-                prop_info["type"] = [prop_info["type"], "null"]
-                schema["required"].append(prop)
-
-    elif schema["type"] == "array":
-        if "items" not in schema:
-            return
-
-        _adjust_schema(schema["items"])
+    # Walk the schema with an explicit stack. The type is captured when a node
+    # is pushed, as optional properties get a nullable type before they are
+    # visited.
+    stack: list[tuple[dict[str, Any], Any]] = [(schema, schema["type"])]
+    while stack:
+        node, node_type = stack.pop()
+        if node_type == "object":
+            if "properties" not in node:
+                continue
+
+            required: list[str] = node.setdefault("required", [])
+            required_set = set(required)
+
+            # Ensure all properties are required
+            for prop, prop_info in node["properties"].items():
+                stack.append((prop_info, prop_info["type"]))
+                if prop not in required_set:
+                    prop_info["type"] = [prop_info["type"], "null"]
+                    required.append(prop)
+                    required_set.add(prop)
+
+        elif node_type == "array":
+            if "items" not in node:
+                continue
+
+            stack.append((node["items"], node["items"]["type"]))
 
 
 def _format_structured_output(
@@ -133,16 +192,6 @@ def _format_tool(
     custom_serializer: Callable[[Any], Any] | None,
 ) -> ChatCompletionFunctionToolParam:
     """Format tool specification."""
-    try:
-        from openai.types.shared_params import FunctionDefinition
-    except ImportError:
-        FunctionDefinition = dict  # type: ignore[assignment,misc]
-
-    try:
-        from openai.types.chat import ChatCompletionFunctionToolParam as ToolParam
-    except ImportError:
-        ToolParam = dict  # type: ignore[assignment,misc]
-
     tool_spec = FunctionDefinition(
         name=tool.name,
         parameters=convert(tool.parameters, custom_serializer=custom_serializer),
@@ -152,202 +201,336 @@ def _format_tool(
 
     # Create tool param compatible with both old and new OpenAI versions
     try:
-        return ToolParam(type="function", function=tool_spec)
+        return ChatCompletionFunctionToolParam(type="function", function=tool_spec)
     except (TypeError, AttributeError):
         # Fallback to dict format for older versions
         return {"type": "function", "function": tool_spec}
 
 
-def _convert_content_to_chat_message(
-    content: conversation.Content,
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to JSON, using orjson where it supports the input.
+
+    orjson rejects some input json.dumps accepts, such as namedtuples and
+    integers beyond 64 bits, so fall back to the standard library for those.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj)
+
+
+def _read_file(path: str | os.PathLike[str]) -> bytes:
+    """Read a file as bytes."""
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _find_attribute(obj: Any, names: tuple[str, ...]) -> tuple[str | None, Any]:
+    """Return the first of names set to a truthy value on obj."""
+    attrs = getattr(obj, "__dict__", None) or {}
+    for name in names:
+        value = attrs[name] if name in attrs else getattr(obj, name, None)
+        if value:
+            return name, value
+    return None, None
+
+
+def _image_data_url(content_type: str, image_content: bytes) -> str:
+    """Encode image bytes as a base64 data URL.
+
+    The payload is encoded in chunks straight into a preallocated buffer, so
+    the only full size copies are the buffer itself and the returned string.
+    """
+    prefix = f"data:{content_type};base64,".encode()
+    buffer = bytearray(len(prefix) + (len(image_content) + 2) // 3 * 4)
+    buffer[: len(prefix)] = prefix
+    offset = len(prefix)
+    view = memoryview(image_content)
+    for start in range(0, len(view), _BASE64_CHUNK_SIZE):
+        encoded = base64.b64encode(view[start : start + _BASE64_CHUNK_SIZE])
+        buffer[offset : offset + len(encoded)] = encoded
+        offset += len(encoded)
+    return buffer.decode("ascii")
+
+
+def _convert_tool_result_content(
+    content: conversation.ToolResultContent,
+    attachment_parts: Mapping[int, list[dict[str, Any]]] | None,
 ) -> ChatCompletionMessageParam | None:
-    """Convert any native chat message for this agent to the native format."""
-    from openai.types.chat import (
-        ChatCompletionAssistantMessageParam,
-        ChatCompletionSystemMessageParam,
-        ChatCompletionToolMessageParam,
-        ChatCompletionUserMessageParam,
+    """Convert a tool result to a tool message."""
+    return ChatCompletionToolMessageParam(
+        role="tool",
+        tool_call_id=content.tool_call_id,
+        content=_json_dumps(content.tool_result),
     )
 
-    try:
-        from openai.types.chat import ChatCompletionMessageFunctionToolCallParam
-    except ImportError:
-        ChatCompletionMessageFunctionToolCallParam = dict  # type: ignore[assignment,misc]
+
+def _convert_system_content(
+    content: conversation.SystemContent,
+    attachment_parts: Mapping[int, list[dict[str, Any]]] | None,
+) -> ChatCompletionMessageParam | None:
+    """Convert a system prompt to a system message."""
+    if not content.content:
+        return None
+    return ChatCompletionSystemMessageParam(role="system", content=content.content)
+
+
+def _encode_attachment(attachment: Any) -> dict[str, Any] | None:
+    """Encode an image attachment as a message part.
+
+    This may read the file backing the attachment, so it should run in the
+    executor.
+    """
+    LOGGER.debug("Processing attachment: %s", type(attachment))
+
+    # Try different ways to get content type
+    _, content_type = _find_attribute(attachment, _CONTENT_TYPE_ATTRS)
+    if not content_type:
+        # Try to guess from filename if available
+        _, filename = _find_attribute(attachment, ("filename",))
+        if filename:
+            content_type = _IMAGE_CONTENT_TYPES.get(
+                os.path.splitext(filename.lower())[1]
+            )
+        # Default to image/jpeg if we can't determine
+        if not content_type:
+            content_type = 'image/jpeg'
+            LOGGER.warning("Could not determine content type, defaulting to: %s", content_type)
+
+    LOGGER.debug("Processing attachment with content type: %s", content_type)
+
+    if not content_type.startswith("image/"):
+        return None
 
     try:
-        from openai.types.chat.chat_completion_message_function_tool_call_param import Function
-    except ImportError:
-        Function = dict  # type: ignore[assignment,misc]
+        # Get the content data - try many different attributes
+        content_source, image_content = _find_attribute(attachment, _CONTENT_ATTRS)
 
-    LOGGER.debug("_convert_content_to_chat_message=%s", content)
-    if isinstance(content, conversation.ToolResultContent):
-        return ChatCompletionToolMessageParam(
-            role="tool",
-            tool_call_id=content.tool_call_id,
-            content=json.dumps(content.tool_result),
-        )
+        # If still no content, try to read from file path/url
+        if not image_content:
+            path_attr, file_path = _find_attribute(attachment, _FILE_PATH_ATTRS)
+            if file_path:
+                try:
+                    image_content = _read_file(file_path)
+                    content_source = path_attr
+                    LOGGER.debug("Loaded image content from %s", path_attr)
+                except OSError as e:
+                    LOGGER.error("Failed to read file %s: %s", file_path, e)
+            elif hasattr(attachment, 'url'):
+                LOGGER.debug("Attachment has URL but no direct content")
+
+        if not image_content:
+            LOGGER.warning("Could not extract image content from attachment")
+            return None
+
+        LOGGER.debug("Using image content from: %s", content_source)
+
+        # Convert image attachment to base64 URL format
+        if isinstance(image_content, str):
+            # Assume it's already base64 if string, possibly as a data URL.
+            # The payload follows the last comma, so scan from the end.
+            image_data = (
+                image_content.rsplit(",", 1)[-1]
+                if image_content.startswith("data:")
+                else image_content
+            )
+            image_url = f"data:{content_type};base64,{image_data}"
+        else:
+            image_url = _image_data_url(content_type, image_content)
+
+        LOGGER.debug("Added image attachment: %s", content_type)
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": image_url,
+                "detail": "high"  # Use high detail for better analysis
+            }
+        }
+    except Exception as e:
+        LOGGER.error("Failed to process image attachment: %s", e)
+        # Add error message to chat instead
+        return {
+            "type": "text",
+            "text": f"[Error: Could not process image attachment - {e}]"
+        }
 
-    role: Literal["user", "assistant", "system"] = content.role
-    if role == "system" and content.content:
-        return ChatCompletionSystemMessageParam(role="system", content=content.content)
 
-    if role == "user":
-        # Handle user messages with potential attachments
-        if isinstance(content, conversation.UserContent) and content.attachments:
-            # Create multi-part content with text and images
-            message_parts = []
-            
-            # Add text content if present
-            if content.content:
-                message_parts.append({
-                    "type": "text",
-                    "text": content.content
-                })
-            
-            # Add attachments (images, etc.)
-            for attachment in content.attachments:
-                LOGGER.debug("Processing attachment: %s", type(attachment))
-                
-                # Try different ways to get content type
-                content_type = None
-                if hasattr(attachment, 'content_type'):
-                    content_type = attachment.content_type
-                elif hasattr(attachment, 'mime_type'):
-                    content_type = attachment.mime_type
-                elif hasattr(attachment, 'type'):
-                    content_type = attachment.type
-                else:
-                    # Try to guess from filename if available
-                    if hasattr(attachment, 'filename'):
-                        filename = attachment.filename.lower()
-                        if filename.endswith(('.jpg', '.jpeg')):
-                            content_type = 'image/jpeg'
-                        elif filename.endswith('.png'):
-                            content_type = 'image/png'
-                        elif filename.endswith('.webp'):
-                            content_type = 'image/webp'
-                        elif filename.endswith('.gif'):
-                            content_type = 'image/gif'
-                    # Default to image/jpeg if we can't determine
-                    if not content_type:
-                        content_type = 'image/jpeg'
-                        LOGGER.warning("Could not determine content type, defaulting to: %s", content_type)
-                
-                LOGGER.debug("Processing attachment with content type: %s", content_type)
-                
-                if content_type and content_type.startswith("image/"):
-                    try:
-                        # Get the content data - try many different attributes
-                        image_content = None
-                        content_source = None
-                        
-                        # List of possible content attributes
-                        content_attrs = ['content', 'data', 'binary_data', 'bytes', 'file_content', 'image_data', 'payload']
-                        
-                        for attr in content_attrs:
-                            if hasattr(attachment, attr):
-                                image_content = getattr(attachment, attr)
-                                if image_content:  # Check if not None/empty
-                                    content_source = attr
-                                    LOGGER.debug("Found image content via %s", attr)
-                                    break
-                        
-                        # If still no content, try to read from file path/url
-                        if not image_content:
-                            if hasattr(attachment, 'file_path') and attachment.file_path:
-                                try:
-                                    with open(attachment.file_path, 'rb') as f:
-                                        image_content = f.read()
-                                        content_source = 'file_path'
-                                        LOGGER.debug("Loaded image content from file")
-                                except Exception as e:
-                                    LOGGER.error("Failed to read file %s: %s", attachment.file_path, e)
-                            elif hasattr(attachment, 'path') and attachment.path:
-                                try:
-                                    with open(attachment.path, 'rb') as f:
-                                        image_content = f.read()
-                                        content_source = 'path'
-                                        LOGGER.debug("Loaded image content from path")
-                                except Exception as e:
-                                    LOGGER.error("Failed to read path %s: %s", attachment.path, e)
-                            elif hasattr(attachment, 'url'):
-                                LOGGER.debug("Attachment has URL but no direct content")
-                        
-                        if not image_content:
-                            LOGGER.warning("Could not extract image content from attachment")
-                            continue
-                        
-                        LOGGER.debug("Using image content from: %s", content_source)
-                            
-                        # Convert image attachment to base64 URL format
-                        if isinstance(image_content, bytes):
-                            image_data = base64.b64encode(image_content).decode('utf-8')
-                        else:
-                            # Assume it's already base64 if string
-                            image_data = image_content.replace('data:', '').split(',')[-1] if 'data:' in str(image_content) else str(image_content)
-                        
-                        message_parts.append({
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{content_type};base64,{image_data}",
-                                "detail": "high"  # Use high detail for better analysis
-                            }
-                        })
-                        LOGGER.debug("Added image attachment: %s", content_type)
-                    except Exception as e:
-                        LOGGER.error("Failed to process image attachment: %s", e)
-                        # Add error message to chat instead
-                        message_parts.append({
-                            "type": "text",
-                            "text": f"[Error: Could not process image attachment - {e}]"
-                        })
-            
-            if message_parts:
-                return ChatCompletionUserMessageParam(role="user", content=message_parts)
-        
-        # Fallback to simple text message
+def _convert_user_content(
+    content: conversation.UserContent,
+    attachment_parts: Mapping[int, list[dict[str, Any]]] | None,
+) -> ChatCompletionMessageParam | None:
+    """Convert user input, including image attachments, to a user message."""
+    # Handle user messages with potential attachments
+    if isinstance(content, conversation.UserContent) and content.attachments:
+        # Create multi-part content with text and images
+        message_parts = []
+
+        # Add text content if present
         if content.content:
-            return ChatCompletionUserMessageParam(role="user", content=content.content)
+            message_parts.append({
+                "type": "text",
+                "text": content.content
+            })
 
-    if role == "assistant":
-        param = ChatCompletionAssistantMessageParam(
-            role="assistant",
-            content=content.content,
-        )
-        if isinstance(content, conversation.AssistantContent) and content.tool_calls:
-            tool_calls = []
-            for tool_call in content.tool_calls:
-                try:
-                    # Try new OpenAI format first
-                    tool_calls.append(ChatCompletionMessageFunctionToolCallParam(
-                        type="function",
-                        id=tool_call.id,
-                        function=Function(
-                            arguments=json.dumps(tool_call.tool_args),
-                            name=tool_call.tool_name,
-                        ),
-                    ))
-                except (TypeError, AttributeError):
-                    # Fallback to dict format for older versions
-                    tool_calls.append({
-                        "type": "function",
-                        "id": tool_call.id,
-                        "function": {
-                            "arguments": json.dumps(tool_call.tool_args),
-                            "name": tool_call.tool_name,
-                        },
-                    })
-            param["tool_calls"] = tool_calls
-        return param
+        # Add attachments (images, etc.), as encoded by _async_encode_attachments
+        if attachment_parts:
+            message_parts.extend(attachment_parts.get(id(content), ()))
+
+        if message_parts:
+            return ChatCompletionUserMessageParam(role="user", content=message_parts)
+
+    # Fallback to simple text message
+    if content.content:
+        return ChatCompletionUserMessageParam(role="user", content=content.content)
+    return None
+
+
+def _convert_assistant_content(
+    content: conversation.AssistantContent,
+    attachment_parts: Mapping[int, list[dict[str, Any]]] | None,
+) -> ChatCompletionMessageParam | None:
+    """Convert an assistant response, including tool calls, to an assistant message."""
+    param = ChatCompletionAssistantMessageParam(
+        role="assistant",
+        content=content.content,
+    )
+    if isinstance(content, conversation.AssistantContent) and content.tool_calls:
+        tool_calls = []
+        for tool_call in content.tool_calls:
+            try:
+                # Try new OpenAI format first
+                tool_calls.append(ChatCompletionMessageFunctionToolCallParam(
+                    type="function",
+                    id=tool_call.id,
+                    function=Function(
+                        arguments=_json_dumps(tool_call.tool_args),
+                        name=tool_call.tool_name,
+                    ),
+                ))
+            except (TypeError, AttributeError):
+                # Fallback to dict format for older versions
+                tool_calls.append({
+                    "type": "function",
+                    "id": tool_call.id,
+                    "function": {
+                        "arguments": _json_dumps(tool_call.tool_args),
+                        "name": tool_call.tool_name,
+                    },
+                })
+        param["tool_calls"] = tool_calls
+    return param
+
+
+# Converters by content role
+_CONTENT_CONVERTERS: dict[
+    str,
+    Callable[
+        [Any, Mapping[int, list[dict[str, Any]]] | None],
+        ChatCompletionMessageParam | None,
+    ],
+] = {
+    "tool_result": _convert_tool_result_content,
+    "system": _convert_system_content,
+    "user": _convert_user_content,
+    "assistant": _convert_assistant_content,
+}
+
+
+def _convert_content_to_chat_message(
+    content: conversation.Content,
+    attachment_parts: Mapping[int, list[dict[str, Any]]] | None = None,
+) -> ChatCompletionMessageParam | None:
+    """Convert any native chat message for this agent to the native format.
+
+    attachment_parts holds the encoded attachment parts of user content, keyed
+    by the id of the content, as built by _async_encode_attachments.
+    """
+    LOGGER.debug("_convert_content_to_chat_message=%s", content)
+    converter = _CONTENT_CONVERTERS.get(content.role)
+    if converter is not None and (
+        message := converter(content, attachment_parts)
+    ) is not None:
+        return message
     LOGGER.warning("Could not convert message to Completions API: %s", content)
     return None
 
 
+def _is_converted(content: conversation.Content) -> bool:
+    """Return if the message for content has already been memoized."""
+    return _MESSAGE_ATTR in getattr(content, "__dict__", ())
+
+
+def _convert_content_cached(
+    content: conversation.Content,
+    attachment_parts: Mapping[int, list[dict[str, Any]]] | None = None,
+) -> ChatCompletionMessageParam | None:
+    """Convert content, reusing an earlier conversion of the same object.
+
+    Chat log content is immutable and kept for the whole conversation, so the
+    message is memoized on the content itself and reused on later turns.
+    """
+    if (attrs := getattr(content, "__dict__", None)) is None:
+        return _convert_content_to_chat_message(content, attachment_parts)
+    if _MESSAGE_ATTR in attrs:
+        return attrs[_MESSAGE_ATTR]
+
+    message = _convert_content_to_chat_message(content, attachment_parts)
+    # Encoded attachments only yield text parts for errors, keep converting
+    # that content so the attachment is retried on the next turn
+    if not attachment_parts or not any(
+        part["type"] == "text" for part in attachment_parts.get(id(content), ())
+    ):
+        # Content dataclasses are frozen, so bypass __setattr__
+        attrs[_MESSAGE_ATTR] = message
+    return message
+
+
+def _compute_backoff(
+    status_code: int, attempt: int, headers: Mapping[str, str] | None
+) -> float:
+    """Return the delay in seconds before retrying a failed request.
+
+    A Retry-After header given in seconds is honored, otherwise the delay
+    grows exponentially with jitter so clients don't retry in lockstep.
+    """
+    if headers and (retry_after := headers.get("retry-after")):
+        try:
+            return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+    delay = RETRY_BASE_DELAYS[status_code] * 2**attempt * (0.5 + random.random())
+    return min(MAX_RETRY_DELAY, delay)
+
+
+def _extract_error_metadata(err: openai.APIStatusError) -> tuple[str, str]:
+    """Return the provider name and error detail of an API status error.
+
+    The openai client already decoded the error body, and unwrapped its
+    "error" object, so use that instead of parsing the response again.
+    """
+    provider_name = "Unknown"
+    error_detail = str(err)
+    error_info = err.body
+    if isinstance(error_info, dict) and isinstance(error_info.get("error"), dict):
+        error_info = error_info["error"]
+    if not isinstance(error_info, dict):
+        return provider_name, error_detail
+
+    metadata = error_info.get("metadata")
+    if not isinstance(metadata, dict):
+        metadata = {}
+    provider_name = metadata.get("provider_name", provider_name)
+    error_detail = error_info.get("message", error_detail)
+    if raw_detail := metadata.get("raw"):
+        error_detail = f"{error_detail} ({raw_detail})"
+    return provider_name, error_detail
+
+
 def _decode_tool_arguments(arguments: str) -> Any:
     """Decode tool call arguments."""
     try:
-        return json.loads(arguments)
-    except json.JSONDecodeError as err:
+        return orjson.loads(arguments)
+    except orjson.JSONDecodeError as err:
         raise HomeAssistantError(f"Unexpected tool argument response: {err}") from err
 
 
@@ -389,6 +572,36 @@ class OpenRouterEntity(Entity):
             entry_type=dr.DeviceEntryType.SERVICE,
         )
 
+    async def _async_encode_attachments(
+        self, chat_log: conversation.ChatLog
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Encode the attachments of unconverted user content concurrently."""
+        contents = [
+            content
+            for content in chat_log.content
+            if isinstance(content, conversation.UserContent)
+            and content.attachments
+            and not _is_converted(content)
+        ]
+        if not contents:
+            return {}
+
+        encoded = iter(
+            await asyncio.gather(
+                *(
+                    self.hass.async_add_executor_job(_encode_attachment, attachment)
+                    for content in contents
+                    for attachment in content.attachments
+                )
+            )
+        )
+        return {
+            id(content): [
+                part for _ in content.attachments if (part := next(encoded))
+            ]
+            for content in contents
+        }
+
     async def _async_handle_chat_log(
         self,
         chat_log: conversation.ChatLog,
@@ -396,23 +609,6 @@ class OpenRouterEntity(Entity):
         structure: vol.Schema | None = None,
     ) -> None:
         """Generate an answer for the chat log."""
-        import openai
-
-        try:
-            from openai.types.shared_params import ResponseFormatJSONSchema
-        except ImportError:
-            ResponseFormatJSONSchema = dict  # type: ignore[assignment,misc]
-
-        model_args = {
-            "model": self.model,
-            "user": chat_log.conversation_id,
-            "extra_headers": {
-                "X-Title": "Home Assistant",
-                "HTTP-Referer": "https://www.home-assistant.io/integrations/open_router",
-            },
-            "extra_body": {"require_parameters": True},
-        }
-
         tools: list[ChatCompletionFunctionToolParam] | None = None
         if chat_log.llm_api:
             tools = [
@@ -420,15 +616,19 @@ class OpenRouterEntity(Entity):
                 for tool in chat_log.llm_api.tools
             ]
 
-        if tools:
-            model_args["tools"] = tools
-
-        model_args["messages"] = [
-            m
-            for content in chat_log.content
-            if (m := _convert_content_to_chat_message(content))
-        ]
-
+        attachment_parts = await self._async_encode_attachments(chat_log)
+        messages: list[ChatCompletionMessageParam] = []
+        has_images = False
+        for content in chat_log.content:
+            if not (m := _convert_content_cached(content, attachment_parts)):
+                continue
+            messages.append(m)
+            # Note if we're sending images, only multi-part user messages can
+            # carry them
+            if not has_images and isinstance(parts := m.get("content"), list):
+                has_images = any(part["type"] == "image_url" for part in parts)
+
+        response_format: ResponseFormatJSONSchema | openai.NotGiven = openai.NOT_GIVEN
         if structure:
             if TYPE_CHECKING:
                 assert structure_name is not None
@@ -436,28 +636,20 @@ class OpenRouterEntity(Entity):
             json_schema = _format_structured_output(
                 structure_name, structure, chat_log.llm_api
             )
-            try:
-                # Try new OpenAI format first
-                model_args["response_format"] = ResponseFormatJSONSchema(
+            if _HAS_RF_JSON_SCHEMA:
+                response_format = ResponseFormatJSONSchema(
                     type="json_schema",
                     json_schema=json_schema,
                 )
-            except (TypeError, AttributeError):
-                # Fallback to dict format for compatibility
-                model_args["response_format"] = {
+            else:
+                # Fallback to dict format for older OpenAI versions
+                response_format = {
                     "type": "json_schema",
                     "json_schema": json_schema,
                 }
 
         client = self.entry.runtime_data
 
-        # Check if we're sending images to a non-vision model
-        has_images = any(
-            isinstance(msg.get("content"), list) and 
-            any(part.get("type") == "image_url" for part in msg.get("content", []))
-            for msg in model_args.get("messages", [])
-        )
-        
         if has_images:
             LOGGER.info("Sending image content to model: %s", self.model)
             
@@ -465,10 +657,19 @@ class OpenRouterEntity(Entity):
             # Retry logic for transient errors
             max_retries = 2
             last_error = None
+            result = None
 
             for retry_attempt in range(max_retries + 1):
                 try:
-                    result = await client.chat.completions.create(**model_args)
+                    result = await client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        tools=tools or openai.NOT_GIVEN,
+                        response_format=response_format,
+                        user=chat_log.conversation_id,
+                        extra_headers=EXTRA_HEADERS,
+                        extra_body=EXTRA_BODY,
+                    )
                     break  # Success, exit retry loop
                 except openai.BadRequestError as err:
                     # Handle 400 errors - usually permanent
@@ -493,28 +694,17 @@ class OpenRouterEntity(Entity):
                     status_code = err.status_code
 
                     # Try to extract provider and error details
-                    provider_name = "Unknown"
-                    error_detail = str(err)
-                    try:
-                        if hasattr(err, 'response') and err.response:
-                            error_data = err.response.json() if hasattr(err.response, 'json') else {}
-                            if isinstance(error_data, dict):
-                                error_info = error_data.get('error', {})
-                                provider_name = error_info.get('metadata', {}).get('provider_name', 'Unknown')
-                                error_detail = error_info.get('message', str(err))
-                                raw_detail = error_info.get('metadata', {}).get('raw', '')
-                                if raw_detail:
-                                    error_detail = f"{error_detail} ({raw_detail})"
-                    except Exception:
-                        pass  # Use default error_detail
+                    provider_name, error_detail = _extract_error_metadata(err)
 
                     # Handle specific status codes
                     if status_code == 503:
                         # Service unavailable - temporary capacity issue
                         if retry_attempt < max_retries:
-                            retry_delay = 5 * (retry_attempt + 1)  # 5s, 10s
+                            retry_delay = _compute_backoff(
+                                status_code, retry_attempt, err.response.headers
+                            )
                             LOGGER.warning(
-                                "Provider '%s' temporarily unavailable (attempt %d/%d). Retrying in %ds...",
+                                "Provider '%s' temporarily unavailable (attempt %d/%d). Retrying in %.1fs...",
                                 provider_name, retry_attempt + 1, max_retries + 1, retry_delay
                             )
                             last_error = err
@@ -529,9 +719,11 @@ class OpenRouterEntity(Entity):
                     elif status_code == 429:
                         # Rate limit - could be temporary
                         if retry_attempt < max_retries:
-                            retry_delay = 10 * (retry_attempt + 1)  # 10s, 20s
+                            retry_delay = _compute_backoff(
+                                status_code, retry_attempt, err.response.headers
+                            )
                             LOGGER.warning(
-                                "Rate limited by provider '%s' (attempt %d/%d). Retrying in %ds...",
+                                "Rate limited by provider '%s' (attempt %d/%d). Retrying in %.1fs...",
                                 provider_name, retry_attempt + 1, max_retries + 1, retry_delay
                             )
                             last_error = err
@@ -560,7 +752,7 @@ class OpenRouterEntity(Entity):
 
             # If we exited retry loop due to max retries, the break above wasn't hit
             # So we need to check if result was set
-            if 'result' not in locals():
+            if result is None:
                 if last_error:
                     raise HomeAssistantError("Failed after retries") from last_error
                 else:
@@ -568,14 +760,10 @@ class OpenRouterEntity(Entity):
 
             result_message = result.choices[0].message
 
-            model_args["messages"].extend(
-                [
-                    msg
-                    async for content in chat_log.async_add_delta_content_stream(
-                        self.entity_id, _transform_response(result_message)
-                    )
-                    if (msg := _convert_content_to_chat_message(content))
-                ]
-            )
+            async for content in chat_log.async_add_delta_content_stream(
+                self.entity_id, _transform_response(result_message)
+            ):
+                if (msg := _convert_content_cached(content)) is not None:
+                    messages.append(msg)
             if not chat_log.unresponded_tool_results:
                 break